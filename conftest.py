@@ -11,6 +11,7 @@ from elasticsearch_dsl.connections import get_connection
 from pytest_django.lazy_django import skip_if_no_django
 from xdist.scheduler import LoadScopeScheduling
 
+from course_discovery.apps.api.utils import clear_retired_type_ids_cache
 from course_discovery.apps.core.tests.factories import PartnerFactory, SiteFactory
 
 logger = logging.getLogger(__name__)
@@ -128,6 +129,10 @@ def client():
 def clear_caches(request):
     for existing_cache in caches.all():
         existing_cache.clear()
+    # Retired type ids are also memoized in the request cache, which outlives the test's database transaction.
+    clear_retired_type_ids_cache()
+    yield
+    clear_retired_type_ids_cache()
 
 
 @pytest.fixture(scope='session', autouse=True)
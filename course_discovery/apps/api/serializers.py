@@ -2314,7 +2314,8 @@ class ProgramSerializer(MinimalProgramSerializer):
         )
 
     def get_applicable_seat_types(self, obj):
-        return list(obj.type.applicable_seat_types.values_list('slug', flat=True))
+        # Iterate over .all() so the `type__applicable_seat_types` prefetch is used instead of issuing a new query.
+        return [seat_type.slug for seat_type in obj.type.applicable_seat_types.all()]
 
     def get_topics(self, obj):
         return [topic.name for topic in obj.topics]
@@ -1,9 +1,12 @@
 """ Utilities for working with JWT during testing."""
+from functools import lru_cache
 from time import time
 
 import jwt
 from django.conf import settings
 
+JWT_HEADER_PREFIX = 'JWT '
+
 
 def generate_jwt_payload(user, payload=None):
     """Generate a valid JWT payload given a user."""
@@ -22,14 +25,22 @@ def generate_jwt_payload(user, payload=None):
     return jwt_payload
 
 
+@lru_cache(maxsize=None)
+def _prepared_signing_key(algorithm, secret_key):
+    """Prepare (parse) the signing key once per algorithm/key pair rather than on every encode."""
+    return jwt.get_algorithm_by_name(algorithm).prepare_key(secret_key)
+
+
 def generate_jwt_token(payload):
     """Generate a valid JWT token for authenticated requests."""
-    return jwt.encode(payload, settings.JWT_AUTH['JWT_SECRET_KEY'])
+    algorithm = settings.JWT_AUTH['JWT_ALGORITHM']
+    signing_key = _prepared_signing_key(algorithm, settings.JWT_AUTH['JWT_SECRET_KEY'])
+    return jwt.encode(payload, signing_key, algorithm=algorithm)
 
 
 def generate_jwt_header(token):
     """Generate a valid JWT header given a token."""
-    return f'JWT {token}'
+    return JWT_HEADER_PREFIX + token
 
 
 def generate_jwt_header_for_user(user, payload=None):
@@ -5,22 +5,24 @@ from unittest import mock
 import ddt
 import pytest
 import responses
-from django.core.files.base import ContentFile
-from django.test import TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
 from opaque_keys.edx.keys import CourseKey
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 from rest_framework.views import APIView
 
 from course_discovery.apps.api.utils import (
-    StudioAPI, cast2int, decode_image_data, get_query_param, increment_character, increment_str
+    StudioAPI, cast2int, decode_image_data, get_query_param, get_retired_run_type_ids, get_run_from_course_key,
+    increment_str, reviewable_data_has_changed
 )
 from course_discovery.apps.api.v1.tests.test_views.mixins import APITestCase, OAuth2Mixin
 from course_discovery.apps.core.tests.factories import UserFactory
 from course_discovery.apps.core.utils import serialize_datetime
 from course_discovery.apps.course_metadata.models import CourseType
 from course_discovery.apps.course_metadata.tests.factories import (
-    CourseEditorFactory, CourseFactory, CourseRunFactory, CourseTypeFactory
+    CourseEditorFactory, CourseFactory, CourseRunFactory, CourseRunTypeFactory, CourseTypeFactory, PrerequisiteFactory,
+    SubjectFactory
 )
 
 LOGGER_PATH = 'course_discovery.apps.api.utils.logger.exception'
@@ -83,7 +85,75 @@ class TestDecodeImageData(TestCase):
         img_name, img_data = decode_image_data(test_image)
         assert img_name == 'tmp.png'
         assert img_data is not None
-        assert isinstance(img_data, ContentFile)
+        assert isinstance(img_data, SimpleUploadedFile)
+        assert img_data.content_type == 'image/png'
+        assert img_data.size == len(img_data.read())
+
+
+class TestReviewableDataHasChanged(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.subjects = SubjectFactory.create_batch(2)
+        self.prerequisites = PrerequisiteFactory.create_batch(2)
+        self.course = CourseFactory(title='Title', subjects=self.subjects)
+        self.course.prerequisites.set(self.prerequisites)
+
+    def test_unchanged(self):
+        new_key_vals = [
+            ('title', 'Title'),
+            ('subjects', self.subjects),
+            ('prerequisites', list(reversed(self.prerequisites))),
+        ]
+        assert reviewable_data_has_changed(self.course, new_key_vals) == []
+
+    def test_changed_field_does_not_leak_into_unchanged_m2m(self):
+        new_key_vals = [
+            ('title', 'New Title'),
+            ('subjects', self.subjects),
+            ('prerequisites', self.prerequisites),
+        ]
+        assert reviewable_data_has_changed(self.course, new_key_vals) == ['title']
+
+    def test_sorted_m2m_order_change(self):
+        new_key_vals = [('subjects', list(reversed(self.subjects)))]
+        assert reviewable_data_has_changed(self.course, new_key_vals) == ['subjects']
+
+    def test_exempt_fields(self):
+        new_key_vals = [('title', 'New Title'), ('subjects', [])]
+        assert reviewable_data_has_changed(self.course, new_key_vals, ['title']) == ['subjects']
+
+
+class TestRetiredTypeIds(TestCase):
+    @override_settings(RETIRED_RUN_TYPES=['retired-run-type'])
+    def test_cached_until_types_change(self):
+        assert get_retired_run_type_ids() == ()
+        with self.assertNumQueries(0):
+            assert get_retired_run_type_ids() == ()
+
+        run_type = CourseRunTypeFactory(slug='retired-run-type')
+        assert get_retired_run_type_ids() == (run_type.id,)
+
+        run_type.delete()
+        assert get_retired_run_type_ids() == ()
+
+    def test_cache_refreshed_on_setting_change(self):
+        run_type = CourseRunTypeFactory()
+        assert run_type.id not in get_retired_run_type_ids()
+
+        with override_settings(RETIRED_RUN_TYPES=[run_type.slug]):
+            assert get_retired_run_type_ids() == (run_type.id,)
+
+
+@ddt.ddt
+class TestGetRunFromCourseKey(TestCase):
+    @ddt.data(
+        ('course-v1:edX+DemoX+1T2017a', '1T2017a'),
+        ('edX/DemoX/2014', '2014'),
+        ('course-v1:edX+DemoX+1T2017+branch@draft', '1T2017'),
+    )
+    @ddt.unpack
+    def test_get_run_from_course_key(self, key, expected):
+        assert get_run_from_course_key(key) == expected
 
 
 class TestGetQueryParam:
@@ -198,7 +268,7 @@ class StudioAPITests(OAuth2Mixin, APITestCase):
             output_data = StudioAPI.generate_data_for_studio_api(run, False)
             assert output_data == expected_data
         mock_logger.info.assert_called_with(
-            f'Enrollment information added to data {output_data} for course run {run.key}'
+            'Enrollment information added to data %s for course run %s', output_data, run.key
         )
 
     def test_generate_data_for_studio_api__external_course_missing_enrollment_dates(self):
@@ -214,7 +284,7 @@ class StudioAPITests(OAuth2Mixin, APITestCase):
 
         with self.assertRaises(AssertionError):
             mock_logger.info.assert_called_with(
-                f'Enrollment information added to data {output_data} for course run {run.key}'
+                'Enrollment information added to data %s for course run %s', output_data, run.key
             )
 
     def test_calculate_course_run_key_run_value_with_multiple_runs_per_trimester(self):
@@ -252,16 +322,9 @@ class StudioAPITests(OAuth2Mixin, APITestCase):
 @ddt.ddt
 class IncrementStringTests:
     @ddt.data(
-        ('a', 'b'),
-        ('z', 'a'),
         ('', 'a'),
-    )
-    @ddt.unpack
-    def test_increment_character(self, value, expected):
-        assert increment_character(value) == expected
-
-    @ddt.data(
         ('a', 'b'),
+        ('z', 'aa'),
         ('zz', 'aaa'),
         ('az', 'ba'),
         ('azz', 'baa'),
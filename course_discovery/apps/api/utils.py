@@ -1,11 +1,14 @@
-import base64
+import binascii
 import functools
 import logging
 import math
-from urllib.parse import parse_qsl, urlencode, urljoin
+from collections import namedtuple
+from urllib.parse import urljoin
 
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models import Value
 from django.db.models.fields.related import ManyToManyField
 from django.utils.translation import gettext as _
 from edx_django_utils.cache import RequestCache
@@ -20,6 +23,10 @@ from course_discovery.apps.course_metadata.models import CourseRun, CourseRunTyp
 
 logger = logging.getLogger(__name__)
 
+BASE64_DATA_URI_SEPARATOR = ';base64,'
+COURSE_KEY_V1_PREFIX = 'course-v1:'
+ALL_RESTRICTION_TYPES = tuple(CourseRunRestrictionType.values)
+
 
 def cast2int(value, name):
     """
@@ -73,16 +80,15 @@ def update_query_params_with_body_data(func_to_decorate):
 
     @functools.wraps(func_to_decorate)
     def wrapper(self, request, *args, **kwargs):
-        _data = request.data.copy()
-        for key, value in _data.items():
-            if isinstance(value, (list, tuple)) and len(value) == 1:
-                _data[key] = value[0]
-
-        encoded_data = urlencode(_data, True)
         _mutable = request.query_params._mutable  # pylint: disable=protected-access
         request.query_params._mutable = True  # pylint: disable=protected-access
-        for key, value in parse_qsl(encoded_data):
-            request.query_params.appendlist(key, value)
+        for key, value in request.data.items():
+            values = value if isinstance(value, (list, tuple)) else (value,)
+            for item in values:
+                item = str(item)
+                # Blank values are skipped, matching how they used to be dropped when parsing a query string.
+                if item:
+                    request.query_params.appendlist(key, item)
         request.query_params._mutable = _mutable  # pylint: disable=protected-access
 
         return func_to_decorate(self, request, *args, **kwargs)
@@ -102,27 +108,28 @@ def reviewable_data_has_changed(obj, new_key_vals, exempt_fields=None):
     Returns:
         list of changed field names
     """
-    changed = False
     changed_fields = []
-    exempt_fields = exempt_fields or []
-    for key, new_value in [x for x in new_key_vals if x[0] not in exempt_fields]:
+    exempt_fields = frozenset(exempt_fields or ())
+    for key, new_value in new_key_vals:
+        if key in exempt_fields:
+            continue
+
         original_value = getattr(obj, key, None)
         if isinstance(new_value, list):
             field_class = obj.__class__._meta.get_field(key).__class__
-            original_value_elements = original_value.all()
-            if len(new_value) != original_value_elements.count():
+            new_ids = [getattr(element, 'pk', element) for element in new_value]
+            original_ids = list(original_value.values_list('pk', flat=True))
+            if len(new_ids) != len(original_ids):
                 changed = True
             # Just use set compare since none of our fields require duplicates
-            elif field_class == ManyToManyField and set(new_value) != set(original_value_elements):
-                changed = True
+            elif field_class == ManyToManyField:
+                changed = set(new_ids) != set(original_ids)
             elif field_class == SortedManyToManyField:
-                for new_value_element, original_value_element in zip(new_value, original_value_elements):
-                    if new_value_element != original_value_element:
-                        changed = True
-        elif new_value != original_value:
-            changed = True
+                changed = new_ids != original_ids
+            else:
+                changed = False
         else:
-            changed = False
+            changed = new_value != original_value
 
         if changed:
             changed_fields.append(key)
@@ -137,9 +144,13 @@ def conditional_decorator(condition_getter, decorator):
     If callable evaluates to `True`, the provided decorator is applied, otherwise, the function remains unmodified.
     """
     def wrapper(func):
+        # Apply the decorator once up front; only the choice between the two versions happens per call.
+        decorated_func = decorator(func)
+
+        @functools.wraps(func)
         def wrapped(*args, **kwargs):
             if condition_getter():
-                return decorator(func)(*args, **kwargs)
+                return decorated_func(*args, **kwargs)
             return func(*args, **kwargs)
         return wrapped
     return wrapper
@@ -150,9 +161,15 @@ def decode_image_data(image_data):
     Given a encoded base64 image, it will decode encoded image and
     return image name and decoded image_data
     """
-    file_format, img_str = image_data.split(';base64,')  # format ~= data:image/X;base64,/xxxyyyzzz/
-    ext = file_format.split('/')[-1]  # guess file extension
-    image_data = ContentFile(base64.b64decode(img_str), name=f'tmp.{ext}')
+    # format ~= data:image/X;base64,/xxxyyyzzz/
+    separator_index = image_data.find(BASE64_DATA_URI_SEPARATOR)
+    if separator_index == -1:
+        raise ValueError('Image data is not a base64 encoded data URI.')
+
+    content_type = image_data[:separator_index].removeprefix('data:')
+    ext = content_type.rsplit('/', 1)[-1]  # guess file extension
+    img_str = image_data[separator_index + len(BASE64_DATA_URI_SEPARATOR):]
+    image_data = SimpleUploadedFile(f'tmp.{ext}', binascii.a2b_base64(img_str), content_type=content_type)
     return image_data.name, image_data
 
 
@@ -196,23 +213,46 @@ def increment_str(input_str):
     2. given a string 'z' and it will return 'aa'
     3. given a string 'az' and it will return 'ba'
     """
-    lpart = input_str.rstrip('z')
-    num_replacements = len(input_str) - len(lpart)
-    new_str = lpart[:-1] + increment_character(lpart[-1]) if lpart else 'a'
-    new_str += 'a' * num_replacements
-    return new_str
+    # Treat the string as a bijective base-26 number ('a' == 1, ..., 'z' == 26) so the
+    # 'z' -> 'aa' rollover falls out of the arithmetic.
+    value = 0
+    for character in input_str:
+        value = value * 26 + (ord(character) - 96)
+    value += 1
+
+    characters = []
+    while value:
+        value, remainder = divmod(value - 1, 26)
+        characters.append(chr(97 + remainder))
+    return ''.join(reversed(characters))
 
 
-def increment_character(character):
+def get_excluded_restriction_types(request):
     """
-    Given a character and it will return its next character using ASCII code
+    Return the tuple of course run restriction types that were not opted into via ``include_restricted``.
+
+    The tuple keeps the order of ``CourseRunRestrictionType`` and can be passed as is to both ORM ``__in`` lookups
+    and Elasticsearch ``terms`` filters.
     """
-    return chr(ord(character) + 1) if character != 'z' else 'a'
+    include_restricted = {
+        restriction_type for restriction_type in request.query_params.get('include_restricted', '').split(',')
+        if restriction_type
+    }
+    return tuple(
+        restriction_type for restriction_type in ALL_RESTRICTION_TYPES if restriction_type not in include_restricted
+    )
 
 
-def get_excluded_restriction_types(request):
-    include_restricted = request.query_params.get('include_restricted', '').split(',')
-    return list(set(CourseRunRestrictionType.values) - set(include_restricted))
+@functools.lru_cache(maxsize=4096)
+def get_run_from_course_key(key):
+    """
+    Return the run component of a serialized course key.
+
+    Keys in the common ``course-v1:org+course+run`` format are split directly; anything else is fully parsed.
+    """
+    if key.startswith(COURSE_KEY_V1_PREFIX) and key.count('+') == 2:
+        return key.rsplit('+', 1)[1]
+    return CourseKey.from_string(key).run
 
 
 class StudioAPI:
@@ -226,18 +266,16 @@ class StudioAPI:
         self._api = partner.oauth_api_client
         # In our unit tests, urljoin has trouble with a mock str object vs a real str, so we ensure a real string here.
         self._url = str(partner.studio_url)
+        self._api_base_url = urljoin(self._url, 'api/v1/')
 
     @classmethod
     def _get_next_run(cls, root, suffix, existing_runs):
-        candidate = root + suffix
-
-        if candidate in existing_runs:
-            # If our candidate is an existing run, use the next letter in the alphabet as the
-            # run suffix (e.g. 1T2017, 1T2017a, 1T2017b, ...).
+        # While our candidate is an existing run, use the next letter in the alphabet as the
+        # run suffix (e.g. 1T2017, 1T2017a, 1T2017b, ...).
+        while root + suffix in existing_runs:
             suffix = increment_str(suffix)
-            return cls._get_next_run(root, suffix, existing_runs)
 
-        return candidate
+        return root + suffix
 
     @classmethod
     def calculate_course_run_key_run_value(cls, course_num, start):
@@ -245,13 +283,12 @@ class StudioAPI:
         run = f'{trimester}T{start.year}'
 
         related_course_runs = CourseRun.everything.filter(key__contains=course_num).values_list('key', flat=True)
-        related_course_runs = [CourseKey.from_string(key).run for key in related_course_runs]
+        related_course_runs = {get_run_from_course_key(key) for key in related_course_runs}
 
         return cls._get_next_run(run, '', related_course_runs)
 
     @classmethod
     def generate_data_for_studio_api(cls, course_run, creating, user=None):
-        editors = [editor.user for editor in course_run.course.editors.all()]
         key = CourseKey.from_string(course_run.key)
 
         # start, end, and pacing are not sent on updates - Studio is where users edit them
@@ -261,6 +298,7 @@ class StudioAPI:
         enrollment_start = course_run.enrollment_start
         enrollment_end = course_run.enrollment_end
 
+        editors = [editor.user for editor in course_run.course.editors.select_related('user')]
         if user:
             editors.append(user)
 
@@ -300,16 +338,16 @@ class StudioAPI:
             # But when the course run is created, in Studio or Discovery, the enrollment dates are not taken as input.
             # It is better to keep the flow consistent across places.
             # Allow sending enrollment start and end dates as part of Update only.
-            data['schedule'] = {
-                'enrollment_start': serialize_datetime(course_run.enrollment_start),
-                'enrollment_end': serialize_datetime(course_run.enrollment_end),
-            }
-            logger.info(f"Enrollment information added to data {data} for course run {course_run.key}")
+            data.setdefault('schedule', {}).update({
+                'enrollment_start': serialize_datetime(enrollment_start),
+                'enrollment_end': serialize_datetime(enrollment_end),
+            })
+            logger.info('Enrollment information added to data %s for course run %s', data, course_run.key)
 
         return data
 
     def _make_studio_url(self, path):
-        return urljoin(self._url, 'api/v1/' + path)
+        return self._api_base_url + path
 
     def _request(self, method, path, **kwargs):
         url = self._make_studio_url(path)
@@ -399,31 +437,74 @@ def use_request_cache(cache_name, key_func):
         find_factors(12345)  # This will skip the expensive calculation and return cached value.
     """
     def inner(fn):
+        # RequestCache only holds the namespace; its data is looked up per request, so one instance can be shared.
+        request_cache = RequestCache(cache_name)
+
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
-            cache = RequestCache(cache_name)
             cache_key = key_func(*args, **kwargs)
-            cached_response = cache.get_cached_response(cache_key)
+            cached_response = request_cache.get_cached_response(cache_key)
             if cached_response.is_found:
                 return cached_response.value
 
             result = fn(*args, **kwargs)
 
-            cache.set(cache_key, result)
+            request_cache.set(cache_key, result)
             return result
         return wrapper
     return inner
 
 
-@use_request_cache("retired_run_types_cache", lambda: "retired_run_types")
+# Retired type ids only change along with the RETIRED_* settings or the type tables themselves, so they are kept in the
+# Django cache instead of being looked up again on every request, and memoized per request in front of it. Saving or
+# deleting a CourseType/CourseRunType clears both (see course_metadata.signals); changes that bypass model signals,
+# e.g. QuerySet.update(), are picked up once the Django cache entry expires.
+RetiredTypeIds = namedtuple('RetiredTypeIds', 'run_type_ids course_type_ids')
+RETIRED_TYPE_IDS_CACHE_NAME = 'retired_type_ids_cache'
+RETIRED_TYPE_IDS_CACHE_KEY = 'retired_type_ids'
+RETIRED_TYPE_IDS_CACHE_TIMEOUT = 60 * 15
+
+
+def _get_retired_slugs():
+    return tuple(sorted(settings.RETIRED_RUN_TYPES)), tuple(sorted(settings.RETIRED_COURSE_TYPES))
+
+
+@use_request_cache(RETIRED_TYPE_IDS_CACHE_NAME, _get_retired_slugs)
+def _get_retired_type_ids():
+    retired_slugs = _get_retired_slugs()
+    cached = cache.get(RETIRED_TYPE_IDS_CACHE_KEY)
+    if cached is not None and cached[0] == retired_slugs:
+        return cached[1]
+
+    # Fetch the retired ids of both type tables in a single round trip.
+    retired_run_types = CourseRunType.objects.filter(slug__in=settings.RETIRED_RUN_TYPES).annotate(
+        kind=Value('run')
+    ).values_list('id', 'kind')
+    retired_course_types = CourseType.objects.filter(slug__in=settings.RETIRED_COURSE_TYPES).annotate(
+        kind=Value('course')
+    ).values_list('id', 'kind')
+
+    run_type_ids = []
+    course_type_ids = []
+    for type_id, kind in retired_run_types.union(retired_course_types, all=True):
+        if kind == 'run':
+            run_type_ids.append(type_id)
+        else:
+            course_type_ids.append(type_id)
+
+    retired_type_ids = RetiredTypeIds(run_type_ids=tuple(run_type_ids), course_type_ids=tuple(course_type_ids))
+    cache.set(RETIRED_TYPE_IDS_CACHE_KEY, (retired_slugs, retired_type_ids), RETIRED_TYPE_IDS_CACHE_TIMEOUT)
+    return retired_type_ids
+
+
+def clear_retired_type_ids_cache():
+    RequestCache(RETIRED_TYPE_IDS_CACHE_NAME).clear()
+    cache.delete(RETIRED_TYPE_IDS_CACHE_KEY)
+
+
 def get_retired_run_type_ids():
-    return list(
-        CourseRunType.objects.filter(slug__in=settings.RETIRED_RUN_TYPES).values_list('id', flat=True)
-    )
+    return _get_retired_type_ids().run_type_ids
 
 
-@use_request_cache("retired_course_types_cache", lambda: "retired_course_types")
 def get_retired_course_type_ids():
-    return list(
-        CourseType.objects.filter(slug__in=settings.RETIRED_COURSE_TYPES).values_list('id', flat=True)
-    )
+    return _get_retired_type_ids().course_type_ids
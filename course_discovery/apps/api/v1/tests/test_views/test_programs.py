@@ -1,20 +1,23 @@
 import datetime
+import functools
 import urllib.parse
 from unittest import mock
 
 import pytest
 import pytz
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import RequestFactory
 from django.urls import reverse
+from freezegun import freeze_time
 from taggit.models import Tag
 
 from course_discovery.apps.api.serializers import MinimalProgramSerializer
-from course_discovery.apps.api.v1.tests.test_views.mixins import FuzzyInt, SerializationMixin
+from course_discovery.apps.api.v1.tests.test_views.mixins import SerializationMixin
 from course_discovery.apps.api.v1.views.programs import ProgramViewSet
 from course_discovery.apps.core.tests.factories import USER_PASSWORD, UserFactory
 from course_discovery.apps.core.tests.helpers import make_image_file
 from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
-from course_discovery.apps.course_metadata.models import CourseType, Program, ProgramType
+from course_discovery.apps.course_metadata.models import Program
 from course_discovery.apps.course_metadata.tests.factories import (
     CorporateEndorsementFactory, CourseFactory, CourseRunFactory, CurriculumCourseMembershipFactory, CurriculumFactory,
     CurriculumProgramMembershipFactory, DegreeAdditionalMetadataFactory, DegreeFactory, EndorsementFactory,
@@ -22,6 +25,29 @@ from course_discovery.apps.course_metadata.tests.factories import (
     ProgramTypeFactory, RestrictedCourseRunFactory, VideoFactory
 )
 
+CARD_IMAGE_DATA = (
+    'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNk+A8AAQUBAScY42YAAAAASUVORK5CYII='
+)
+
+# Resolve the per-program URLs once and substitute the UUID, rather than calling reverse() in every test.
+PLACEHOLDER_UUID = '00000000-0000-0000-0000-000000000000'
+DETAIL_URL_TEMPLATE = reverse('api:v1:program-detail', kwargs={'uuid': PLACEHOLDER_UUID})
+UPDATE_CARD_IMAGE_URL_TEMPLATE = reverse('api:v1:program-update-card-image', kwargs={'uuid': PLACEHOLDER_UUID})
+
+
+def program_url(template, program):
+    return template.replace(PLACEHOLDER_UUID, str(program.uuid))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_image_bytes(name):
+    """ Encode the test image once; each caller still gets its own file object. """
+    return make_image_file(name).read()
+
+
+def make_cached_image_file(name):
+    return SimpleUploadedFile(name, _cached_image_bytes(name), content_type='image/jpeg')
+
 
 @pytest.mark.django_db
 @pytest.mark.usefixtures('django_cache')
@@ -48,6 +74,11 @@ class TestProgramViewSet(SerializationMixin):
         self.partner = partner
         self.request = request
 
+    @functools.cached_property
+    def topic_tag(self):
+        topic, _ = Tag.objects.get_or_create(name="topic")
+        return topic
+
     def create_program(self, courses=None, program_type=None, include_restricted_run=False):
         organizations = [OrganizationFactory(partner=self.partner)]
         person = PersonFactory()
@@ -62,8 +93,6 @@ class TestProgramViewSet(SerializationMixin):
         if program_type is None:
             program_type = ProgramTypeFactory()
 
-        topic, _ = Tag.objects.get_or_create(name="topic")
-
         program = ProgramFactory(
             courses=courses,
             authoring_organizations=organizations,
@@ -73,13 +102,15 @@ class TestProgramViewSet(SerializationMixin):
             expected_learning_items=ExpectedLearningItemFactory.create_batch(1),
             job_outlook_items=JobOutlookItemFactory.create_batch(1),
             instructor_ordering=PersonFactory.create_batch(1),
-            banner_image=make_image_file('test_banner.jpg'),
+            banner_image=make_cached_image_file('test_banner.jpg'),
             video=VideoFactory(),
             partner=self.partner,
             type=program_type,
         )
-        program.labels.add(topic)
-        program.refresh_from_db()
+        program.labels.add(self.topic_tag)
+        # The m2m signal handlers only write these columns behind the instance's back (via QuerySet.update()),
+        # so there is no need to reload the whole row.
+        program.refresh_from_db(fields=['data_modified_timestamp', 'enterprise_subscription_inclusion'])
         return program
 
     def create_curriculum(self, parent_program):
@@ -99,7 +130,7 @@ class TestProgramViewSet(SerializationMixin):
 
     def assert_retrieve_success(self, program, querystring=None):
         """ Verify the retrieve endpoint successfully returns a serialized program. """
-        url = reverse('api:v1:program-detail', kwargs={'uuid': program.uuid})
+        url = program_url(DETAIL_URL_TEMPLATE, program)
 
         if querystring:
             url += '?' + urllib.parse.urlencode(querystring)
@@ -121,7 +152,7 @@ class TestProgramViewSet(SerializationMixin):
         """ Verify the endpoint returns the details for a single program. """
         program = self.create_program()
 
-        with django_assert_num_queries(FuzzyInt(68, 3)):
+        with django_assert_num_queries(67):
             response = self.assert_retrieve_success(program)
         # property does not have the right values while being indexed
         del program._course_run_weeks_to_complete
@@ -135,7 +166,7 @@ class TestProgramViewSet(SerializationMixin):
         program = self.create_program(courses=[])
         self.create_curriculum(program)
         program.refresh_from_db()
-        with django_assert_num_queries(FuzzyInt(52, 3)):
+        with django_assert_num_queries(51):
             response = self.assert_retrieve_success(program)
         assert response.data == self.serialize_program(program)
 
@@ -154,7 +185,7 @@ class TestProgramViewSet(SerializationMixin):
             curriculum=curriculum
         )
         parent_program.refresh_from_db()
-        with django_assert_num_queries(FuzzyInt(85, 3)):
+        with django_assert_num_queries(84):
             response = self.assert_retrieve_success(parent_program)
         assert response.data == self.serialize_program(parent_program)
 
@@ -170,7 +201,7 @@ class TestProgramViewSet(SerializationMixin):
             partner=self.partner)
         # property does not have the right values while being indexed
         del program._course_run_weeks_to_complete
-        with django_assert_num_queries(FuzzyInt(51, 3)):
+        with django_assert_num_queries(50):
             response = self.assert_retrieve_success(program)
         assert response.data == self.serialize_program(program)
         assert course_list == list(program.courses.all())
@@ -192,7 +223,7 @@ class TestProgramViewSet(SerializationMixin):
         """ Verify the endpoint returns data for a program even if the program's courses have no course runs. """
         course = CourseFactory(partner=self.partner)
         program = ProgramFactory(courses=[course], partner=self.partner)
-        with django_assert_num_queries(FuzzyInt(40, 2)):
+        with django_assert_num_queries(39):
             response = self.assert_retrieve_success(program)
         assert response.data == self.serialize_program(program)
 
@@ -210,7 +241,7 @@ class TestProgramViewSet(SerializationMixin):
         Returns:
             None
         """
-        with self.django_assert_num_queries(FuzzyInt(expected_query_count, 2)):
+        with self.django_assert_num_queries(expected_query_count):
             response = self.client.get(url)
         assert response.data['results'] == self.serialize_program(expected, many=True, extra_context=extra_context)
 
@@ -272,15 +303,18 @@ class TestProgramViewSet(SerializationMixin):
 
         assert set(response.data) == {program.uuid for program in retired}
 
-    def test_filter_by_type(self):
+    @pytest.mark.parametrize(
+        'type_param,is_match,expected_query_count',
+        (
+            ('foo', True, 17),
+            ('bar', False, 5),
+        )
+    )
+    def test_filter_by_type(self, type_param, is_match, expected_query_count):
         """ Verify that the endpoint filters programs to those of a given type. """
-        program_type_name = 'foo'
-        program = ProgramFactory(type__name_t=program_type_name, partner=self.partner)
-        url = self.list_path + '?type=' + program_type_name
-        self.assert_list_results(url, [program], 17)
-
-        url = self.list_path + '?type=bar'
-        self.assert_list_results(url, [], 5)
+        program = ProgramFactory(type__name_t='foo', partner=self.partner)
+        url = self.list_path + '?type=' + type_param
+        self.assert_list_results(url, [program] if is_match else [], expected_query_count)
 
     def test_filter_by_types(self):
         """ Verify that the endpoint filters programs to those matching the provided ProgramType slugs. """
@@ -297,29 +331,30 @@ class TestProgramViewSet(SerializationMixin):
         """
         Verify that the endpoint filters programs based on modified timestamp.
         """
-        program1 = ProgramFactory(partner=self.partner)
-        program2 = ProgramFactory(partner=self.partner)
-        program3 = ProgramFactory(partner=self.partner)
+        with freeze_time('2024-01-01 00:00:00') as frozen_time:
+            programs = ProgramFactory.create_batch(3, partner=self.partner)
 
-        timestamp_now = datetime.datetime.now().isoformat()
-        for programobj in [program1, program2, program3]:
-            programobj.subtitle = 'test update'
-            programobj.save()
+            frozen_time.tick(datetime.timedelta(seconds=1))
+            timestamp_now = datetime.datetime.now().isoformat()
+            for programobj in programs:
+                programobj.subtitle = 'test update'
+                programobj.save()
 
-        url = f"{self.list_path}?timestamp={timestamp_now}"
-        response = self.client.get(url)
-        assert response.status_code == 200
-        assert len(response.data['results']) == 3
+            url = f"{self.list_path}?timestamp={timestamp_now}"
+            response = self.client.get(url)
+            assert response.status_code == 200
+            assert len(response.data['results']) == 3
 
-        # programs saved without modification do not show up in filtering
-        timestamp_now = datetime.datetime.now().isoformat()
-        for programobj in [program1, program2, program3]:
-            programobj.save()
+            # programs saved without modification do not show up in filtering
+            frozen_time.tick(datetime.timedelta(seconds=1))
+            timestamp_now = datetime.datetime.now().isoformat()
+            for programobj in programs:
+                programobj.save()
 
-        url = f"{self.list_path}?timestamp={timestamp_now}"
-        response = self.client.get(url)
-        assert response.status_code == 200
-        assert len(response.data['results']) == 0
+            url = f"{self.list_path}?timestamp={timestamp_now}"
+            response = self.client.get(url)
+            assert response.status_code == 200
+            assert len(response.data['results']) == 0
 
     def test_filter_by_uuids(self):
         """ Verify that the endpoint filters programs to those matching the provided UUIDs. """
@@ -349,36 +384,36 @@ class TestProgramViewSet(SerializationMixin):
         assert list(Program.objects.marketable()) == expected
         self.assert_list_results(url, expected, expected_query_count)
 
-    def test_filter_by_status(self):
+    @pytest.mark.parametrize(
+        'querystring,expected_statuses,expected_query_count',
+        (
+            ('status=active', [ProgramStatus.Active], 17),
+            ('status=retired', [ProgramStatus.Retired], 17),
+            ('status=active&status=retired', [ProgramStatus.Active, ProgramStatus.Retired], 18),
+        )
+    )
+    def test_filter_by_status(self, querystring, expected_statuses, expected_query_count):
         """ Verify the endpoint allows programs to filtered by one, or more, statuses. """
-        active = ProgramFactory(status=ProgramStatus.Active, partner=self.partner)
-        retired = ProgramFactory(status=ProgramStatus.Retired, partner=self.partner)
-
-        url = self.list_path + '?status=active'
-        self.assert_list_results(url, [active], 17)
-
-        url = self.list_path + '?status=retired'
-        self.assert_list_results(url, [retired], 17)
+        programs = {
+            status: ProgramFactory(status=status, partner=self.partner)
+            for status in (ProgramStatus.Active, ProgramStatus.Retired)
+        }
 
-        url = self.list_path + '?status=active&status=retired'
-        self.assert_list_results(url, [active, retired], 18)
+        url = self.list_path + '?' + querystring
+        expected = [programs[status] for status in expected_statuses]
+        self.assert_list_results(url, expected, expected_query_count)
 
-    def test_filter_by_hidden(self):
+    @pytest.mark.parametrize(
+        'hidden_param,expect_hidden',
+        [('True', True), ('False', False), ('1', True), ('0', False)]
+    )
+    def test_filter_by_hidden(self, hidden_param, expect_hidden):
         """ Endpoint should filter programs by their hidden attribute value. """
         hidden = ProgramFactory(hidden=True, partner=self.partner)
         not_hidden = ProgramFactory(hidden=False, partner=self.partner)
 
-        url = self.list_path + '?hidden=True'
-        self.assert_list_results(url, [hidden], 17)
-
-        url = self.list_path + '?hidden=False'
-        self.assert_list_results(url, [not_hidden], 17)
-
-        url = self.list_path + '?hidden=1'
-        self.assert_list_results(url, [hidden], 17)
-
-        url = self.list_path + '?hidden=0'
-        self.assert_list_results(url, [not_hidden], 17)
+        url = self.list_path + '?hidden=' + hidden_param
+        self.assert_list_results(url, [hidden if expect_hidden else not_hidden], 17)
 
     def test_filter_by_marketing_slug(self):
         """ The endpoint should support filtering programs by marketing slug. """
@@ -408,56 +443,34 @@ class TestProgramViewSet(SerializationMixin):
         mock_request.query_params = dict()  # lint-amnesty, pylint: disable=use-dict-literal
         assert ProgramViewSet(action='list', request=mock_request).get_serializer_class() == MinimalProgramSerializer
 
-    def test_update_card_image(self):
-        program = self.create_program()
-        image_dict = {
-            'image': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNk+A8AAQUBAScY'
-                     '42YAAAAASUVORK5CYII=',
-        }
-        update_url = reverse('api:v1:program-update-card-image', kwargs={'uuid': program.uuid})
-        response = self.client.post(update_url, image_dict, format='json')
-        assert response.status_code == 200
-
-    def test_update_card_image_authentication(self):
-        program = self.create_program()
-        self.client.logout()
-        image_dict = {
-            'image': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNk+A8AAQUBAScY'
-                     '42YAAAAASUVORK5CYII=',
-        }
-        update_url = reverse('api:v1:program-update-card-image', kwargs={'uuid': program.uuid})
-        response = self.client.post(update_url, image_dict, format='json')
-        assert response.status_code == 401
-
-    def test_update_card_image_authentication_notstaff(self):
-        program = self.create_program()
-        self.client.logout()
-        user = UserFactory(is_staff=False)
-        self.client.login(username=user.username, password=USER_PASSWORD)
-        image_dict = {
-            'image': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNk+A8AAQUBAScY'
-                     '42YAAAAASUVORK5CYII=',
-        }
-        update_url = reverse('api:v1:program-update-card-image', kwargs={'uuid': program.uuid})
-        response = self.client.post(update_url, image_dict, format='json')
-        assert response.status_code == 403
-
-    def test_update_card_malformed_image(self):
+    @pytest.mark.parametrize(
+        'user_type,image,expected_status',
+        (
+            ('staff', CARD_IMAGE_DATA, 200),
+            ('anonymous', CARD_IMAGE_DATA, 401),
+            ('non_staff', CARD_IMAGE_DATA, 403),
+            ('staff', 'ARandomString', 400),
+        )
+    )
+    def test_update_card_image(self, user_type, image, expected_status):
         program = self.create_program()
-        image_dict = {
-            'image': 'ARandomString',
-        }
-        update_url = reverse('api:v1:program-update-card-image', kwargs={'uuid': program.uuid})
-        response = self.client.post(update_url, image_dict, format='json')
-        assert response.status_code == 400
-
-    def test_enterprise_subscription_inclusion(self):
-        course_type = CourseType.objects.filter(slug=CourseType.VERIFIED_AUDIT).first()
+        if user_type != 'staff':
+            self.client.logout()
+        if user_type == 'non_staff':
+            user = UserFactory(is_staff=False)
+            self.client.login(username=user.username, password=USER_PASSWORD)
+
+        update_url = program_url(UPDATE_CARD_IMAGE_URL_TEMPLATE, program)
+        response = self.client.post(update_url, {'image': image}, format='json')
+        assert response.status_code == expected_status
+
+    def test_enterprise_subscription_inclusion(self, verified_audit_course_type, xseries_program_type):
+        course_type = verified_audit_course_type
         course = CourseFactory(enterprise_subscription_inclusion=True, type=course_type)
         course2 = CourseFactory(enterprise_subscription_inclusion=True, type=course_type)
         course3 = CourseFactory(enterprise_subscription_inclusion=False, type=course_type)
         course_list_false = [course, course2, course3]
-        program_type = ProgramType.objects.get(translations__name_t='XSeries')
+        program_type = xseries_program_type
         program1 = self.create_program(courses=course_list_false, program_type=program_type)
         assert program1.enterprise_subscription_inclusion is False
 
@@ -3,6 +3,7 @@ Data loader responsible for creating course and course runs entries in discovery
 creating and updating related objects in Studio, and ecommerce, provided a csv containing the required information.
 """
 import logging
+from functools import cache
 
 from django.conf import settings
 from django.db.models import Q
@@ -315,25 +316,40 @@ class CSVDataLoader(AbstractDataLoader, DataLoaderMixin):
             course_run = CourseRun.objects.filter_drafts(course=course).order_by('created').last()
         return course_run, is_course_run_created
 
+    @classmethod
+    @cache
+    def get_required_data_fields(cls, course_type_slug, product_source_slug, is_sprint=False):
+        """
+        Return the tuple of data fields required for a course type and product source, using a cache
+        to avoid rebuilding the list for every row.
+
+        Args:
+            course_type_slug (str): Course type slug
+            product_source_slug (str): Product source slug
+            is_sprint (bool): Whether the row's external course marketing type is Sprint
+        """
+        required_fields = cls.BASE_REQUIRED_DATA_FIELDS.copy()
+        type_source_fields = settings.CSV_LOADER_TYPE_SOURCE_REQUIRED_FIELDS.get(course_type_slug, {})
+        if product_source_slug in type_source_fields:
+            required_fields.extend(type_source_fields[product_source_slug])
+            # Remove some fields for specific external course marketing type
+            if is_sprint:
+                required_fields.remove('certificate_header')
+                required_fields.remove('certificate_text')
+        return tuple(required_fields)
+
     def validate_course_data(self, data, course_type=None):
         """
         Verify the required data key-values for a course type are present in the provided
         data dictionary and return a comma separated string of missing data fields.
         """
         missing_fields = []
-        required_fields = self.BASE_REQUIRED_DATA_FIELDS.copy()
-        if (
-                course_type.slug in settings.CSV_LOADER_TYPE_SOURCE_REQUIRED_FIELDS and
-                self.product_source.slug in settings.CSV_LOADER_TYPE_SOURCE_REQUIRED_FIELDS[course_type.slug]
-        ):
-            required_fields.extend(
-                settings.CSV_LOADER_TYPE_SOURCE_REQUIRED_FIELDS[course_type.slug][self.product_source.slug]
-            )
-            # Remove some fields for specific external course marketing type
-            external_course_marketing_type = data.get('external_course_marketing_type', '')
-            if external_course_marketing_type == ExternalCourseMarketingType.Sprint.value:
-                required_fields.remove('certificate_header')
-                required_fields.remove('certificate_text')
+        external_course_marketing_type = data.get('external_course_marketing_type', '')
+        required_fields = self.get_required_data_fields(
+            course_type.slug,
+            self.product_source.slug,
+            external_course_marketing_type == ExternalCourseMarketingType.Sprint.value
+        )
 
         for field in required_fields:
             if not (field in data and data[field]):
@@ -343,6 +359,11 @@ class CSVDataLoader(AbstractDataLoader, DataLoaderMixin):
             return ', '.join(missing_fields)
         return ''
 
+    @classmethod
+    def clear_caches(cls):
+        super().clear_caches()
+        cls.get_required_data_fields.cache_clear()
+
     def _render_course_uuids(self):
         if self.course_uuids:
             logger.info("Course UUIDs:")
@@ -5,7 +5,7 @@ import responses
 
 from course_discovery.apps.api.v1.tests.test_views.mixins import OAuth2Mixin
 from course_discovery.apps.course_metadata.models import (
-    CourseEntitlement, CourseRunStatus, CourseRunType, CourseType, ProgramType, Seat
+    Course, CourseEntitlement, CourseRun, CourseRunStatus, CourseRunType, CourseType, ProgramType, Seat
 )
 from course_discovery.apps.course_metadata.tests.factories import (
     CourseFactory, CourseRunTypeFactory, CourseTypeFactory, LevelTypeFactory, ModeFactory, OrganizationFactory,
@@ -13,6 +13,13 @@ from course_discovery.apps.course_metadata.tests.factories import (
     SubjectFactory, TrackFactory
 )
 
+# PNG. Single black pixel
+MOCK_IMAGE_BODY = (
+    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00'
+    b'\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc```\x00\x00\x00\x04\x00\x01\xf6\x178U\x00\x00\x00\x00'
+    b'IEND\xaeB`\x82'
+)
+
 
 # pylint: disable=not-callable
 class DataLoaderTestMixin(OAuth2Mixin):
@@ -165,10 +172,7 @@ class DegreeCSVLoaderMixin:
         """
         Mock the image download call to return a pre-defined image.
         """
-        # PNG. Single black pixel
-        body = body or b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00' \
-                       b'\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc```\x00\x00\x00\x04\x00\x01\xf6\x178U\x00\x00\x00\x00' \
-                       b'IEND\xaeB`\x82'
+        body = body or MOCK_IMAGE_BODY
         image_url = 'https://example.com/image.jpg'
         responses.add(
             responses.GET,
@@ -396,23 +400,28 @@ class CSVLoaderMixin:
         "fixed_price_usd": Decimal('123.40'),
     }
 
-    def setUp(self):
-        super().setUp()
+    # Expected data for the official (non-draft) versions of the ingested course and course run.
+    OFFICIAL_EXPECTED_COURSE_DATA = {**BASE_EXPECTED_COURSE_DATA, 'draft': False}
+    OFFICIAL_EXPECTED_COURSE_RUN_DATA = {**BASE_EXPECTED_COURSE_RUN_DATA, 'draft': False}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         paid_exec_ed_name = 'Paid Executive Education'
-        self.paid_exec_ed_slug = CourseRunType.PAID_EXECUTIVE_EDUCATION
+        cls.paid_exec_ed_slug = CourseRunType.PAID_EXECUTIVE_EDUCATION
 
         seat_type = SeatTypeFactory(name=paid_exec_ed_name)
-        mode = ModeFactory(name=paid_exec_ed_name, slug=self.paid_exec_ed_slug)
+        mode = ModeFactory(name=paid_exec_ed_name, slug=cls.paid_exec_ed_slug)
         track = TrackFactory(mode=mode, seat_type=seat_type)
-        self.course_run_type = CourseRunTypeFactory(
-            name=paid_exec_ed_name, slug=self.paid_exec_ed_slug, tracks=[track]
+        cls.course_run_type = CourseRunTypeFactory(
+            name=paid_exec_ed_name, slug=cls.paid_exec_ed_slug, tracks=[track]
         )
-        self.course_type = CourseTypeFactory(
+        cls.course_type = CourseTypeFactory(
             name='Executive Education(2U)', slug=CourseType.EXECUTIVE_EDUCATION_2U,
-            course_run_types=[self.course_run_type],
+            course_run_types=[cls.course_run_type],
             entitlement_types=[seat_type]
         )
-        self.source = SourceFactory(slug='ext_source')
+        cls.source = SourceFactory(slug='ext_source')
 
     def _write_csv(self, csv, lines_dict_list, headers=None):
         """
@@ -420,17 +429,10 @@ class CSVLoaderMixin:
         """
         if headers is None:
             headers = self.CSV_DATA_KEYS_ORDER
-        header = ''
-        lines = ''
-        for key in headers:
-            title_case_key = key.replace('_', ' ').title()
-            header = '{}{},'.format(header, title_case_key)
-        header = f"{header[:-1]}\n"
-
-        for line_dict in lines_dict_list:
-            for key in headers:
-                lines = '{}"{}",'.format(lines, line_dict[key])
-            lines = f"{lines[:-1]}\n"
+        header = ','.join(key.replace('_', ' ').title() for key in headers) + '\n'
+        lines = ''.join(
+            ','.join(f'"{line_dict[key]}"' for key in headers) + '\n' for line_dict in lines_dict_list
+        )
 
         csv.write(header.encode())
         csv.write(lines.encode())
@@ -468,19 +470,26 @@ class CSVLoaderMixin:
         """
         Mock the studio api calls.
         """
-        studio_url = '{root}/api/v1/course_runs/'.format(root=partner.studio_url.strip('/'))
+        studio_url = self._studio_course_runs_url(partner)
         responses.add(responses.POST, studio_url, status=200)
         responses.add(responses.PATCH, f'{studio_url}{run_key}/', status=200)
         responses.add(responses.POST, f'{studio_url}{run_key}/images/', status=200)
 
+    def mock_studio_rerun_call(self, partner, run_key=COURSE_RUN_KEY):
+        """
+        Mock the studio api call that creates a rerun of the given course run.
+        """
+        responses.add(responses.POST, f'{self._studio_course_runs_url(partner)}{run_key}/rerun/', status=200)
+
+    @staticmethod
+    def _studio_course_runs_url(partner):
+        return f"{partner.studio_url.strip('/')}/api/v1/course_runs/"
+
     def mock_image_response(self, status=200, body=None, content_type='image/jpeg'):
         """
         Mock the image download call to return a pre-defined image.
         """
-        # PNG. Single black pixel
-        body = body or b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00' \
-                       b'\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc```\x00\x00\x00\x04\x00\x01\xf6\x178U\x00\x00\x00\x00' \
-                       b'IEND\xaeB`\x82'
+        body = body or MOCK_IMAGE_BODY
         image_url = 'https://example.com/image.jpg'
         responses.add(
             responses.GET,
@@ -495,6 +504,13 @@ class CSVLoaderMixin:
         """
         Verify the course's data fields have same values as the expected data dict.
         """
+        # Load the related rows the assertions below walk through up front, rather than one lazy query each.
+        course = Course.everything.select_related(
+            'level_type', 'video', 'type', 'product_source', 'additional_metadata__certificate_info',
+            'additional_metadata__product_meta', 'additional_metadata__taxi_form',
+        ).prefetch_related(
+            'subjects', 'collaborators', 'additional_metadata__facts', 'additional_metadata__product_meta__keywords',
+        ).get(pk=course.pk)
         course_entitlement = CourseEntitlement.everything.get(
             draft=expected_data['draft'], mode__slug=self.paid_exec_ed_slug, course=course
         )
@@ -547,6 +563,9 @@ class CSVLoaderMixin:
         # No need to add draft in the filter here. Based on the draft status of the course run,
         # the appropriate Seat object is returned.
         course_run_seat = Seat.everything.get(type__slug=self.paid_exec_ed_slug, course_run=course_run)
+        course_run = CourseRun.everything.select_related(
+            'expected_program_type', 'language', 'type',
+        ).prefetch_related('staff', 'transcript_languages').get(pk=course_run.pk)
 
         assert course_run.draft is expected_data['draft']
         assert course_run_seat.draft is expected_data['draft']
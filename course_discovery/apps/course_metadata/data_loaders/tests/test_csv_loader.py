@@ -1,15 +1,18 @@
 """
 Unit tests for CSV Data loader.
 """
-import copy
 import datetime
 from decimal import Decimal
-from tempfile import NamedTemporaryFile
+from io import BytesIO
 from unittest import mock
 
+import factory
 import responses
 from ddt import data, ddt, unpack
+from django.db.models import Count, Q
+from django.db.models.signals import post_save
 from edx_toggles.toggles.testutils import override_waffle_switch
+from freezegun import freeze_time
 from pytz import UTC
 from testfixtures import LogCapture
 
@@ -24,7 +27,7 @@ from course_discovery.apps.course_metadata.data_loaders.tests import mock_data
 from course_discovery.apps.course_metadata.data_loaders.tests.mixins import CSVLoaderMixin
 from course_discovery.apps.course_metadata.data_loaders.tests.test_utils import MockExceptionWithResponse
 from course_discovery.apps.course_metadata.models import (
-    AdditionalMetadata, Course, CourseEntitlement, CourseRun, CourseType, Seat, Source, TaxiForm
+    AdditionalMetadata, Course, CourseEntitlement, CourseRun, CourseType, Seat, TaxiForm
 )
 from course_discovery.apps.course_metadata.tests.factories import (
     AdditionalMetadataFactory, CourseFactory, CourseRunFactory, CourseTypeFactory, OrganizationFactory, SourceFactory
@@ -47,10 +50,18 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
     """
     Test Suite for CSVDataLoader.
     """
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = UserFactory.create(username="test_user", password=USER_PASSWORD, is_staff=True)
+        # Course types and sources used by the data validation tests
+        CourseTypeFactory(name='Bootcamp(2U)', slug=CourseType.BOOTCAMP_2U)
+        CourseTypeFactory(name='Professional', slug='prof-ed')
+        SourceFactory(slug='dbz_source')
+
     def setUp(self) -> None:
         super().setUp()
         self.mock_access_token()
-        self.user = UserFactory.create(username="test_user", password=USER_PASSWORD, is_staff=True)
         self.client.login(username=self.user.username, password=USER_PASSWORD)
 
     def mock_call_course_api(self, method, url, payload):
@@ -90,74 +101,49 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
 
         )
 
-    def test_missing_organization(self, jwt_decode_patch):  # pylint: disable=unused-argument
+    def _assert_draft_counts(self, model, official_count, total_count):
         """
-        Verify that no course and course run are created for a missing organization in the database.
+        Assert the number of official (non-draft) rows and of all rows, drafts included, using a single query.
         """
-        with NamedTemporaryFile() as csv:
-            csv = self._write_csv(csv, [mock_data.INVALID_ORGANIZATION_DATA])
-            with LogCapture(LOGGER_PATH) as log_capture:
-                with LogCapture(MIXIN_LOGGER_PATH) as log_capture_mixin:
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-                    self._assert_default_logs(log_capture)
-                    log_capture_mixin.check_present(
-                        (
-                            MIXIN_LOGGER_PATH,
-                            'ERROR',
-                            # pylint: disable=line-too-long
-                            '[MISSING_ORGANIZATION] Unable to locate partner organization with key invalid-organization '
-                            'for the course titled CSV Course.'
-                        )
-                    )
-                    assert Course.objects.count() == 0
-                    assert CourseRun.objects.count() == 0
+        counts = model.everything.aggregate(
+            official=Count('pk', filter=Q(draft=False)),
+            total=Count('pk'),
+        )
+        assert counts == {'official': official_count, 'total': total_count}
 
-    def test_invalid_course_type(self, jwt_decode_patch):  # pylint: disable=unused-argument
+    @data(
+        (
+            mock_data.INVALID_ORGANIZATION_DATA,
+            '[MISSING_ORGANIZATION] Unable to locate partner organization with key invalid-organization '
+            'for the course titled CSV Course.'
+        ),
+        (
+            mock_data.INVALID_COURSE_TYPE_DATA,
+            '[MISSING_COURSE_TYPE] Unable to find the course enrollment track "invalid track"'
+            ' for the course CSV Course'
+        ),
+        (
+            mock_data.INVALID_COURSE_RUN_TYPE_DATA,
+            '[MISSING_COURSE_RUN_TYPE] Unable to find the course run enrollment track "invalid track"'
+            ' for the course CSV Course'
+        ),
+    )
+    @unpack
+    def test_invalid_row_creates_nothing(self, csv_row, expected_error, jwt_decode_patch):  # pylint: disable=unused-argument
         """
-        Verify that no course and course run are created for an invalid course track type.
+        Verify that no course and course run are created for a row with a missing organization or an invalid
+        course or course run track type, and that the matching error is logged.
         """
         self._setup_organization(self.partner)
-        with NamedTemporaryFile() as csv:
-            csv = self._write_csv(csv, [mock_data.INVALID_COURSE_TYPE_DATA])
-            with LogCapture(LOGGER_PATH) as log_capture:
-                with LogCapture(MIXIN_LOGGER_PATH) as log_capture_mixin:
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-                    self._assert_default_logs(log_capture)
-                    log_capture_mixin.check_present(
-                        (
-                            MIXIN_LOGGER_PATH,
-                            'ERROR',
-                            '[MISSING_COURSE_TYPE] Unable to find the course enrollment track "invalid track"'
-                            ' for the course CSV Course'
-                        )
-                    )
-                    assert Course.objects.count() == 0
-                    assert CourseRun.objects.count() == 0
-
-    def test_invalid_course_run_type(self, jwt_decode_patch):  # pylint: disable=unused-argument
-        """
-        Verify that no course and course run are created for an invalid course run track type.
-        """
-        self._setup_organization(self.partner)
-        with NamedTemporaryFile() as csv:
-            csv = self._write_csv(csv, [mock_data.INVALID_COURSE_RUN_TYPE_DATA])
-            with LogCapture(LOGGER_PATH) as log_capture:
-                with LogCapture(MIXIN_LOGGER_PATH) as log_capture_mixin:
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-                    self._assert_default_logs(log_capture)
-                    log_capture_mixin.check_present(
-                        (
-                            MIXIN_LOGGER_PATH,
-                            'ERROR',
-                            '[MISSING_COURSE_RUN_TYPE] Unable to find the course run enrollment track "invalid track"'
-                            ' for the course CSV Course'
-                        )
-                    )
-                    assert Course.objects.count() == 0
-                    assert CourseRun.objects.count() == 0
+        with BytesIO() as csv:
+            csv = self._write_csv(csv, [csv_row])
+            with LogCapture((LOGGER_PATH, MIXIN_LOGGER_PATH)) as log_capture:
+                loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
+                loader.ingest()
+                self._assert_default_logs(log_capture)
+                log_capture.check_present((MIXIN_LOGGER_PATH, 'ERROR', expected_error))
+                assert Course.objects.count() == 0
+                assert CourseRun.objects.count() == 0
 
     @responses.activate
     def test_image_download_failure(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -175,39 +161,38 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             content_type='image/jpeg',
         )
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
-            with LogCapture(LOGGER_PATH) as log_capture:
-                with LogCapture(MIXIN_LOGGER_PATH) as log_capture_mixin:
-                    with mock.patch.object(
-                            CSVDataLoader,
-                            'call_course_api',
-                            self.mock_call_course_api
-                    ):
-                        loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                        loader.ingest()
+            with LogCapture((LOGGER_PATH, MIXIN_LOGGER_PATH)) as log_capture:
+                with mock.patch.object(
+                        CSVDataLoader,
+                        'call_course_api',
+                        self.mock_call_course_api
+                ):
+                    loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
+                    loader.ingest()
 
-                        self._assert_default_logs(log_capture)
-                        log_capture.check_present(
-                            (
-                                LOGGER_PATH,
-                                'INFO',
-                                'Course key edx+csv_123 could not be found in database, creating the course.'
-                            )
+                    self._assert_default_logs(log_capture)
+                    log_capture.check_present(
+                        (
+                            LOGGER_PATH,
+                            'INFO',
+                            'Course key edx+csv_123 could not be found in database, creating the course.'
                         )
+                    )
 
-                        # Creation call results in creating course and course run objects
-                        self.assertEqual(Course.everything.count(), 1)
-                        self.assertEqual(CourseRun.everything.count(), 1)
+                    # Creation call results in creating course and course run objects
+                    self.assertEqual(Course.everything.count(), 1)
+                    self.assertEqual(CourseRun.everything.count(), 1)
 
-                        log_capture_mixin.check_present(
-                            (
-                                MIXIN_LOGGER_PATH,
-                                'ERROR',
-                                '[IMAGE_DOWNLOAD_FAILURE] The course image download failed for the course CSV Course.'
-                            )
+                    log_capture.check_present(
+                        (
+                            MIXIN_LOGGER_PATH,
+                            'ERROR',
+                            '[IMAGE_DOWNLOAD_FAILURE] The course image download failed for the course CSV Course.'
                         )
+                    )
 
     @data(
         ('csv-course-custom-slug', 'executive-education/edx-csv-course', True),
@@ -232,7 +217,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             'is_future_variant': is_future_variant
         }
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [csv_data], headers=[*self.CSV_DATA_KEYS_ORDER, 'is_future_variant'])
 
             with LogCapture(LOGGER_PATH) as log_capture:
@@ -242,7 +227,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                         self.mock_call_course_api
                 ):
                     loader = CSVDataLoader(
-                        self.partner, csv_path=csv.name,
+                        self.partner, csv_file=csv,
                         product_type=self.course_type.slug,
                         product_source=self.source.slug
                     )
@@ -265,8 +250,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                     )
 
                     for model in [Course, CourseRun, Seat, CourseEntitlement]:
-                        assert model.objects.count() == 1
-                        assert model.everything.count() == 2
+                        self._assert_draft_counts(model, official_count=1, total_count=2)
 
                     course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
                     course_run = CourseRun.everything.get(course=course, draft=True)
@@ -279,12 +263,8 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                     self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
                     self._assert_course_run_data(course_run, self.BASE_EXPECTED_COURSE_RUN_DATA)
 
-                    self._assert_course_data(
-                        official_course, {**self.BASE_EXPECTED_COURSE_DATA, 'draft': False}
-                    )
-                    self._assert_course_run_data(
-                        official_course_run, {**self.BASE_EXPECTED_COURSE_RUN_DATA, 'draft': False}
-                    )
+                    self._assert_course_data(official_course, self.OFFICIAL_EXPECTED_COURSE_DATA)
+                    self._assert_course_run_data(official_course_run, self.OFFICIAL_EXPECTED_COURSE_RUN_DATA)
 
                     assert course.entitlements.get().official_version == official_course.entitlements.get()
                     assert course_run.seats.get().official_version == official_course_run.seats.get()
@@ -323,28 +303,29 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         self.mock_ecommerce_publication(self.partner)
         self.mock_image_response()
 
-        additional_metadata_one = AdditionalMetadataFactory(product_status=ExternalProductStatus.Published)
-        CourseFactory(
-            key='test+123', partner=self.partner, type=self.course_type,
-            draft=False, additional_metadata=additional_metadata_one,
-            product_source=self.source
-        )
+        with factory.django.mute_signals(post_save):
+            additional_metadata_one = AdditionalMetadataFactory(product_status=ExternalProductStatus.Published)
+            CourseFactory(
+                key='test+123', partner=self.partner, type=self.course_type,
+                draft=False, additional_metadata=additional_metadata_one,
+                product_source=self.source
+            )
 
-        additional_metadata_two = AdditionalMetadataFactory(product_status=ExternalProductStatus.Published)
-        CourseFactory(
-            key='test+124', partner=self.partner, type=self.course_type,
-            draft=False, additional_metadata=additional_metadata_two,
-            product_source=self.source
-        )
+            additional_metadata_two = AdditionalMetadataFactory(product_status=ExternalProductStatus.Published)
+            CourseFactory(
+                key='test+124', partner=self.partner, type=self.course_type,
+                draft=False, additional_metadata=additional_metadata_two,
+                product_source=self.source
+            )
 
-        additional_metadata__source_2 = AdditionalMetadataFactory(product_status=ExternalProductStatus.Published)
-        CourseFactory(
-            key='test+125', partner=self.partner, type=self.course_type,
-            draft=False, additional_metadata=additional_metadata_two,
-            product_source=SourceFactory(slug='ext_source_2')
-        )
+            additional_metadata__source_2 = AdditionalMetadataFactory(product_status=ExternalProductStatus.Published)
+            CourseFactory(
+                key='test+125', partner=self.partner, type=self.course_type,
+                draft=False, additional_metadata=additional_metadata_two,
+                product_source=SourceFactory(slug='ext_source_2')
+            )
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with LogCapture(LOGGER_PATH) as log_capture:
@@ -355,7 +336,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                 ):
                     loader = CSVDataLoader(
                         self.partner,
-                        csv_path=csv.name,
+                        csv_file=csv,
                         product_type=CourseType.EXECUTIVE_EDUCATION_2U,
                         product_source=self.source.slug
                     )
@@ -424,17 +405,10 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             draft=True,
             variant_id='00000000-0000-0000-0000-000000000000'
         )
-        expected_course_data = {
-            **self.BASE_EXPECTED_COURSE_DATA,
-            'draft': False,
-        }
-        expected_course_run_data = {
-            **self.BASE_EXPECTED_COURSE_RUN_DATA,
-            'draft': False,
-            'status': 'published'
-        }
+        expected_course_data = self.OFFICIAL_EXPECTED_COURSE_DATA
+        expected_course_run_data = self.OFFICIAL_EXPECTED_COURSE_RUN_DATA
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with LogCapture(LOGGER_PATH) as log_capture:
@@ -443,7 +417,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                         'call_course_api',
                         self.mock_call_course_api
                 ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                    loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
                     loader.ingest()
 
                     self._assert_default_logs(log_capture)
@@ -485,6 +459,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                         'errors': loader.error_logs
                     }
 
+    @freeze_time('2023-06-01', tick=True)
     @responses.activate
     def test_ingest_flow_for_preexisting_published_course_with_new_run_creation(self, jwt_decode_patch):  # pylint: disable=unused-argument
         """
@@ -493,31 +468,30 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         """
         self._setup_prerequisites(self.partner)
         self.mock_studio_calls(self.partner)
-        studio_url = '{root}/api/v1/course_runs/'.format(root=self.partner.studio_url.strip('/'))
-        responses.add(responses.POST, f'{studio_url}{self.COURSE_RUN_KEY}/rerun/', status=200)
+        self.mock_studio_rerun_call(self.partner)
         self.mock_studio_calls(self.partner, run_key='course-v1:edx+csv_123+1T2020a')
         self.mock_ecommerce_publication(self.partner)
         self.mock_image_response()
 
-        course = CourseFactory(
-            key=self.COURSE_KEY,
-            partner=self.partner,
-            type=self.course_type,
-            draft=True,
-            key_for_reruns=''
-        )
-        CourseRunFactory(
-            course=course,
-            start=datetime.datetime(2014, 3, 1, tzinfo=UTC),
-            # 2050 end date is to ensure the course run is present among active runs and thus
-            # non-draft entries are created. If the discovery is there till 2050, you would need to update the
-            # tests after Jan 1, 2050.
-            end=datetime.datetime(2050, 1, 1, tzinfo=UTC),
-            key=self.COURSE_RUN_KEY,
-            type=self.course_run_type,
-            status='published',
-            draft=True,
-        )
+        with factory.django.mute_signals(post_save):
+            course = CourseFactory(
+                key=self.COURSE_KEY,
+                partner=self.partner,
+                type=self.course_type,
+                draft=True,
+                key_for_reruns=''
+            )
+            CourseRunFactory(
+                course=course,
+                start=datetime.datetime(2014, 3, 1, tzinfo=UTC),
+                # The end date falls after the frozen test date so that the course run is present among active runs
+                # and thus non-draft entries are created.
+                end=datetime.datetime(2024, 1, 1, tzinfo=UTC),
+                key=self.COURSE_RUN_KEY,
+                type=self.course_run_type,
+                status='published',
+                draft=True,
+            )
         expected_course_data = {
             **self.BASE_EXPECTED_COURSE_DATA,
         }
@@ -527,7 +501,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
 
         assert Seat.everything.count() == 0
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
             with override_waffle_switch(IS_COURSE_RUN_VARIANT_ID_EDITABLE, active=True):
                 with LogCapture(LOGGER_PATH) as log_capture:
@@ -536,7 +510,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                             'call_course_api',
                             self.mock_call_course_api
                     ):
-                        loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                        loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
                         loader.ingest()
 
                         self._assert_default_logs(log_capture)
@@ -617,45 +591,43 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         """
         self._setup_prerequisites(self.partner)
         self.mock_studio_calls(self.partner)
-        studio_url = '{root}/api/v1/course_runs/'.format(root=self.partner.studio_url.strip('/'))
-        responses.add(responses.POST, f'{studio_url}{self.COURSE_RUN_KEY}/rerun/', status=200)
+        self.mock_studio_rerun_call(self.partner)
         self.mock_studio_calls(self.partner, run_key='course-v1:edx+csv_123+1T2020a')
         self.mock_ecommerce_publication(self.partner)
         _, _ = self.mock_image_response()
 
-        course = CourseFactory(
-            key=self.COURSE_KEY,
-            partner=self.partner,
-            type=self.course_type,
-            draft=True,
-            key_for_reruns=''
-        )
+        with factory.django.mute_signals(post_save):
+            course = CourseFactory(
+                key=self.COURSE_KEY,
+                partner=self.partner,
+                type=self.course_type,
+                draft=True,
+                key_for_reruns=''
+            )
 
-        CourseRunFactory(
-            course=course,
-            start=datetime.datetime(2014, 3, 1, tzinfo=UTC),
-            end=datetime.datetime(2040, 3, 1, tzinfo=UTC),
-            key=self.COURSE_RUN_KEY,
-            type=self.course_run_type,
-            status='published',
-            draft=True,
-        )
+            CourseRunFactory(
+                course=course,
+                start=datetime.datetime(2014, 3, 1, tzinfo=UTC),
+                end=datetime.datetime(2040, 3, 1, tzinfo=UTC),
+                key=self.COURSE_RUN_KEY,
+                type=self.course_run_type,
+                status='published',
+                draft=True,
+            )
 
-        mocked_data = copy.deepcopy(mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT)
-        mocked_data.update(
-            {
-                "publish_date": "01/26/2022",
-                "start_date": "01/25/2022",
-                "start_time": "00:00",
-                "end_date": "02/25/2055",
-                "end_time": "00:00",
-                "reg_close_date": "01/25/2055",
-                "reg_close_time": "00:00",
-                "variant_id": "11111111-1111-1111-1111-111111111111",
-            }
-        )
+        mocked_data = {
+            **mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT,
+            "publish_date": "01/26/2022",
+            "start_date": "01/25/2022",
+            "start_time": "00:00",
+            "end_date": "02/25/2055",
+            "end_time": "00:00",
+            "reg_close_date": "01/25/2055",
+            "reg_close_time": "00:00",
+            "variant_id": "11111111-1111-1111-1111-111111111111",
+        }
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT, mocked_data])
             with override_waffle_switch(IS_COURSE_RUN_VARIANT_ID_EDITABLE, active=True):
                 with LogCapture(LOGGER_PATH):
@@ -664,7 +636,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                             'call_course_api',
                             self.mock_call_course_api
                     ):
-                        loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                        loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
                         loader.ingest()
 
                 assert Course.everything.count() == 2
@@ -689,20 +661,18 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             variant_id='00000000-0000-0000-0000-000000000000'
         )
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with mock.patch.object(
                 CSVDataLoader, "call_course_api", self.mock_call_course_api
             ):
                 loader = CSVDataLoader(
-                    self.partner, csv_path=csv.name, product_source=self.source.slug
+                    self.partner, csv_file=csv, product_source=self.source.slug
                 )
 
-                loader.register_ingestion_error = mock.MagicMock()
-                loader.update_course = mock.MagicMock()
-
-                loader.update_course.side_effect = MockExceptionWithResponse(b"Update course error")
+                loader.register_ingestion_error = mock.Mock()
+                loader.update_course = mock.Mock(side_effect=MockExceptionWithResponse(b"Update course error"))
 
                 with LogCapture(LOGGER_PATH):
                     loader.ingest()
@@ -724,8 +694,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         """
         self._setup_prerequisites(self.partner)
         self.mock_studio_calls(self.partner)
-        studio_url = '{root}/api/v1/course_runs/'.format(root=self.partner.studio_url.strip('/'))
-        responses.add(responses.POST, f'{studio_url}{self.COURSE_RUN_KEY}/rerun/', status=200)
+        self.mock_studio_rerun_call(self.partner)
         self.mock_studio_calls(self.partner, run_key='course-v1:edx+csv_123+1T2020a')
         self.mock_ecommerce_publication(self.partner)
         _, _ = self.mock_image_response()
@@ -748,36 +717,31 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             draft=True,
         )
 
-        mocked_data = copy.deepcopy(mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT)
-        mocked_data.update(
-            {
-                "publish_date": "01/26/2022",
-                "start_date": "01/25/2022",
-                "start_time": "00:00",
-                "end_date": "02/25/2055",
-                "end_time": "00:00",
-                "reg_close_date": "01/25/2055",
-                "reg_close_time": "00:00",
-                "variant_id": "11111111-1111-1111-1111-111111111111",
-            }
-        )
+        mocked_data = {
+            **mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT,
+            "publish_date": "01/26/2022",
+            "start_date": "01/25/2022",
+            "start_time": "00:00",
+            "end_date": "02/25/2055",
+            "end_time": "00:00",
+            "reg_close_date": "01/25/2055",
+            "reg_close_time": "00:00",
+            "variant_id": "11111111-1111-1111-1111-111111111111",
+        }
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT, mocked_data])
             with override_waffle_switch(IS_COURSE_RUN_VARIANT_ID_EDITABLE, active=True):
                 with mock.patch.object(
                     CSVDataLoader, "call_course_api", self.mock_call_course_api
                 ):
                     loader = CSVDataLoader(
-                        self.partner, csv_path=csv.name, product_source=self.source.slug
+                        self.partner, csv_file=csv, product_source=self.source.slug
                     )
-                    loader.register_ingestion_error = mock.MagicMock()
+                    loader.register_ingestion_error = mock.Mock()
                     # pylint: disable=protected-access
-                    loader._update_course_entitlement_price = mock.MagicMock()
-
-                    # pylint: disable=protected-access
-                    loader._update_course_entitlement_price.side_effect = (
-                        MockExceptionWithResponse('Entitlement Price Update Error')
+                    loader._update_course_entitlement_price = mock.Mock(
+                        side_effect=MockExceptionWithResponse('Entitlement Price Update Error')
                     )
 
                     with LogCapture(LOGGER_PATH):
@@ -832,11 +796,11 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         course_uuid = course.uuid
         course_type = CourseTypeFactory(slug=CourseType.EXECUTIVE_EDUCATION_2U)
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                loader = CSVDataLoader(self.partner, product_source=self.source.slug, csv_path=csv.name)
+                loader = CSVDataLoader(self.partner, product_source=self.source.slug, csv_file=csv)
                 # pylint: disable=protected-access
                 response = loader._update_course_entitlement_price(req_data, course_uuid, course_type, is_draft=False)
                 mock_reverse.assert_called_once_with("api:v1:course-detail", kwargs={"key": course_uuid})
@@ -878,7 +842,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
 
         mock_download_image.side_effect = download_side_effect
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with mock.patch.object(
@@ -887,7 +851,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                 self.mock_call_course_api
             ):
                 with mock.patch.object(CSVDataLoader, 'register_ingestion_error') as mock_register_error:
-                    loader = CSVDataLoader(self.partner, product_source=self.source.slug, csv_path=csv.name)
+                    loader = CSVDataLoader(self.partner, product_source=self.source.slug, csv_file=csv)
                     loader.ingest()
 
                     expected_error_message = CSVIngestionErrorMessages.LOGO_IMAGE_DOWNLOAD_FAILURE.format(
@@ -907,52 +871,51 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         self.mock_studio_calls(self.partner)
         _, image_content = self.mock_image_response()
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [mock_data.INVALID_LANGUAGE])
 
-            with LogCapture(LOGGER_PATH) as log_capture:
-                with LogCapture(MIXIN_LOGGER_PATH) as log_capture_mixin:
-                    with mock.patch.object(
-                            CSVDataLoader,
-                            'call_course_api',
-                            self.mock_call_course_api
-                    ):
-                        loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                        loader.ingest()
+            with LogCapture((LOGGER_PATH, MIXIN_LOGGER_PATH)) as log_capture:
+                with mock.patch.object(
+                        CSVDataLoader,
+                        'call_course_api',
+                        self.mock_call_course_api
+                ):
+                    loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
+                    loader.ingest()
 
-                        self._assert_default_logs(log_capture)
+                    self._assert_default_logs(log_capture)
 
-                        log_capture.check_present(
-                            (
-                                LOGGER_PATH,
-                                'INFO',
-                                'Course key edx+csv_123 could not be found in database, creating the course.'
-                            ),
-                            (
-                                LOGGER_PATH,
-                                'INFO',
-                                'Draft flag is set to True for the course CSV Course'
-                            )
+                    log_capture.check_present(
+                        (
+                            LOGGER_PATH,
+                            'INFO',
+                            'Course key edx+csv_123 could not be found in database, creating the course.'
+                        ),
+                        (
+                            LOGGER_PATH,
+                            'INFO',
+                            'Draft flag is set to True for the course CSV Course'
                         )
-                        log_capture_mixin.check_present(
-                            (
-                                MIXIN_LOGGER_PATH,
-                                'ERROR',
-                                '[COURSE_RUN_UPDATE_ERROR] Unable to update course run of the course CSV Course '
-                                'in the system. The update failed with the exception: '
-                                'Language gibberish-language from provided string gibberish-language'
-                                ' is either missing or an invalid ietf language'
-                            )
+                    )
+                    log_capture.check_present(
+                        (
+                            MIXIN_LOGGER_PATH,
+                            'ERROR',
+                            '[COURSE_RUN_UPDATE_ERROR] Unable to update course run of the course CSV Course '
+                            'in the system. The update failed with the exception: '
+                            'Language gibberish-language from provided string gibberish-language'
+                            ' is either missing or an invalid ietf language'
                         )
+                    )
 
-                        self.assertEqual(Course.everything.count(), 1)
-                        self.assertEqual(CourseRun.everything.count(), 1)
+                    self.assertEqual(Course.everything.count(), 1)
+                    self.assertEqual(CourseRun.everything.count(), 1)
 
-                        course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
+                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
 
-                        assert course.image.read() == image_content
-                        assert course.organization_logo_override.read() == image_content
-                        self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
+                    assert course.image.read() == image_content
+                    assert course.organization_logo_override.read() == image_content
+                    self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
 
     @responses.activate
     def test_ingest_flow_for_preexisting_unpublished_course(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -977,7 +940,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             fixed_price_usd=111.11
         )
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [{
                 **mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT,
                 "fixed_price_usd": "",
@@ -990,7 +953,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                         self.mock_call_course_api
                 ):
 
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                    loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
                     loader.ingest()
 
                     log_capture.check_present(
@@ -1048,7 +1011,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             fixed_price_usd=111.11
         )
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [{
                 **mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT,
             }])
@@ -1059,7 +1022,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                         self.mock_call_course_api
                 ):
 
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                    loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
                     loader.ingest()
 
                     log_capture.check_present(
@@ -1096,7 +1059,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         self.mock_studio_calls(self.partner)
         self.mock_image_response()
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(
                 csv, [
                     mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT,
@@ -1109,7 +1072,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                         'call_course_api',
                         self.mock_call_course_api
                 ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                    loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
                     loader.ingest()
 
                     self._assert_default_logs(log_capture)
@@ -1158,7 +1121,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         self.mock_ecommerce_publication(self.partner)
         self.mock_studio_calls(self.partner)
         self.mock_image_response()
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(
                 csv, [mock_data.VALID_MINIMAL_COURSE_AND_COURSE_RUN_CSV_DICT], self.MINIMAL_CSV_DATA_KEYS_ORDER
             )
@@ -1169,7 +1132,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                         'call_course_api',
                         self.mock_call_course_api
                 ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                    loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
                     loader.ingest()
 
                     self._assert_default_logs(log_capture)
@@ -1235,7 +1198,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         if reverse_order:
             csv_data = list(reversed(csv_data))
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, csv_data, csv_key_order)
 
             with LogCapture(LOGGER_PATH) as log_capture:
@@ -1244,7 +1207,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                         'call_course_api',
                         self.mock_call_course_api
                 ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                    loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
                     loader.ingest()
 
                     self._assert_default_logs(log_capture)
@@ -1267,7 +1230,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         self.mock_ecommerce_publication(self.partner)
         self.mock_studio_calls(self.partner)
         self.mock_image_response()
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [csv_data], self.CSV_DATA_KEYS_ORDER)
             with LogCapture(LOGGER_PATH) as log_capture:
                 with mock.patch.object(
@@ -1275,7 +1238,7 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                         'call_course_api',
                         self.mock_call_course_api
                 ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                    loader = CSVDataLoader(self.partner, csv_file=csv, product_source=self.source.slug)
                     loader.ingest()
 
                     self._assert_default_logs(log_capture)
@@ -1331,11 +1294,6 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         self._setup_prerequisites(self.partner)
         course_type = ('Executive Education(2U)', 'executive-education-2u')
         product_source = 'ext_source'
-        if not CourseType.objects.filter(name=course_type[0], slug=course_type[1]).exists():
-            CourseTypeFactory(name=course_type[0], slug=course_type[1])
-
-        if not Source.objects.filter(slug=product_source).exists():
-            SourceFactory(slug=product_source)
         csv_data = {
             **mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT,
             'course_enrollment_track': course_type[0],
@@ -1345,28 +1303,27 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         for field in missing_fields:
             csv_data[field] = ''
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [csv_data])
 
-            with LogCapture(LOGGER_PATH) as log_capture:
-                with LogCapture(MIXIN_LOGGER_PATH) as log_capture_mixin:
-                    loader = CSVDataLoader(
-                        self.partner, csv_path=csv.name, product_type=course_type[1], product_source=product_source
-                    )
-                    loader.ingest()
+            with LogCapture((LOGGER_PATH, MIXIN_LOGGER_PATH)) as log_capture:
+                loader = CSVDataLoader(
+                    self.partner, csv_file=csv, product_type=course_type[1], product_source=product_source
+                )
+                loader.ingest()
 
-                    self._assert_default_logs(log_capture)
+                self._assert_default_logs(log_capture)
 
-                    log_capture_mixin.check_present(
-                        (
-                            MIXIN_LOGGER_PATH,
-                            'ERROR',
-                            expected_message
-                        )
+                log_capture.check_present(
+                    (
+                        MIXIN_LOGGER_PATH,
+                        'ERROR',
+                        expected_message
                     )
+                )
 
-                    assert Course.everything.count() == 0
-                    assert CourseRun.everything.count() == 0
+                assert not Course.everything.exists()
+                assert not CourseRun.everything.exists()
 
     @data(
         (['primary_subject', 'image', 'long_description'],
@@ -1414,11 +1371,6 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         Verify that if any of the required field is missing in data, the ingestion is not done.
         """
         self._setup_prerequisites(self.partner)
-        if not CourseType.objects.filter(name=course_type[0], slug=course_type[1]).exists():
-            CourseTypeFactory(name=course_type[0], slug=course_type[1])
-
-        if not Source.objects.filter(slug=product_source).exists():
-            SourceFactory(slug=product_source)
 
         csv_data = {
             **mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT,
@@ -1428,25 +1380,24 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         for field in missing_fields:
             csv_data[field] = ''
 
-        with NamedTemporaryFile() as csv:
+        with BytesIO() as csv:
             csv = self._write_csv(csv, [csv_data])
 
-            with LogCapture(LOGGER_PATH) as log_capture:
-                with LogCapture(MIXIN_LOGGER_PATH) as log_capture_mixin:
-                    loader = CSVDataLoader(
-                        self.partner, csv_path=csv.name, product_type=course_type[1], product_source=product_source
-                    )
-                    loader.ingest()
+            with LogCapture((LOGGER_PATH, MIXIN_LOGGER_PATH)) as log_capture:
+                loader = CSVDataLoader(
+                    self.partner, csv_file=csv, product_type=course_type[1], product_source=product_source
+                )
+                loader.ingest()
 
-                    self._assert_default_logs(log_capture)
+                self._assert_default_logs(log_capture)
 
-                    log_capture_mixin.check_present(
-                        (
-                            MIXIN_LOGGER_PATH,
-                            'ERROR',
-                            expected_message
-                        )
+                log_capture.check_present(
+                    (
+                        MIXIN_LOGGER_PATH,
+                        'ERROR',
+                        expected_message
                     )
+                )
 
-                    assert Course.everything.count() == 0
-                    assert CourseRun.everything.count() == 0
+                assert not Course.everything.exists()
+                assert not CourseRun.everything.exists()
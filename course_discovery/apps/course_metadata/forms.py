@@ -139,7 +139,7 @@ class CourseRunSelectionForm(forms.ModelForm):
             empty_permitted, instance
         )
 
-        query_set = [course.pk for course in instance.courses.all()]
+        query_set = instance.courses.values_list('pk', flat=True)
         self.fields['excluded_course_runs'].widget = forms.widgets.CheckboxSelectMultiple()
         self.fields['excluded_course_runs'].help_text = ''
         self.fields['excluded_course_runs'].queryset = CourseRun.objects.filter(
@@ -254,10 +254,10 @@ class ExcludeSkillsForm(forms.Form):
         """
         super().__init__(*args, **kwargs)
         self.fields['exclude_skills'] = forms.MultipleChoiceField(
-            choices=((course_skill.skill.id, course_skill.skill.name) for course_skill in course_skills),
+            choices=[(course_skill.skill_id, course_skill.skill.name) for course_skill in course_skills],
             required=False,
         )
         self.fields['include_skills'] = forms.MultipleChoiceField(
-            choices=((course_skill.skill.id, course_skill.skill.name) for course_skill in excluded_skills),
+            choices=[(course_skill.skill_id, course_skill.skill.name) for course_skill in excluded_skills],
             required=False,
         )
@@ -1,3 +1,5 @@
+from operator import itemgetter
+
 from django.conf import settings
 from django.db.models import Prefetch
 from django_elasticsearch_dsl import Index, fields
@@ -72,17 +74,29 @@ class LearnerPathwayDocument(BaseDocument, OrganizationsMixin):
         )
 
     def prepare_skill_names(self, obj):
-        return [skill['name'] for skill in obj.skills]
+        return list(map(itemgetter('name'), obj.skills))
 
     def prepare_skills(self, obj):
         return obj.skills
 
+    def parallel_bulk(self, actions, **kwargs):
+        # The bulk requests are sized independently of the ORM pages set by queryset_pagination, so that operators
+        # can tune them per cluster.
+        kwargs.setdefault('chunk_size', settings.ELASTICSEARCH_BULK_CHUNK_SIZE)
+        kwargs.setdefault('thread_count', settings.ELASTICSEARCH_BULK_THREAD_COUNT)
+        kwargs.setdefault('max_chunk_bytes', settings.ELASTICSEARCH_BULK_MAX_CHUNK_BYTES)
+        return super().parallel_bulk(actions, **kwargs)
+
     class Django:
         """
         Django Elasticsearch DSL ORM Meta.
         """
 
         model = LearnerPathway
+        # Read by django-elasticsearch-dsl from this class only: it sets the
+        # chunk size of the indexing iterator (required for the prefetches in
+        # get_queryset to be applied).
+        queryset_pagination = settings.ELASTICSEARCH_DSL_QUERYSET_PAGINATION
 
     class Meta:
         """
@@ -90,4 +104,3 @@ class LearnerPathwayDocument(BaseDocument, OrganizationsMixin):
         """
 
         parallel_indexing = True
-        queryset_pagination = settings.ELASTICSEARCH_DSL_QUERYSET_PAGINATION
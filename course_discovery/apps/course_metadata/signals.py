@@ -19,14 +19,16 @@ from openedx_events.content_authoring.data import CourseCatalogData
 from openedx_events.content_authoring.signals import COURSE_CATALOG_INFO_CHANGED
 
 from course_discovery.apps.api.cache import api_change_receiver
+from course_discovery.apps.api.utils import clear_retired_type_ids_cache
 from course_discovery.apps.core.models import Partner
 from course_discovery.apps.course_metadata.constants import MASTERS_PROGRAM_TYPE_SLUG
 from course_discovery.apps.course_metadata.data_loaders.api import CoursesApiDataLoader
 from course_discovery.apps.course_metadata.models import (
     AdditionalMetadata, BulkOperationTask, CertificateInfo, Course, CourseEditor, CourseEntitlement,
-    CourseLocationRestriction, CourseRun, Curriculum, CurriculumCourseMembership, CurriculumProgramMembership, Degree,
-    DegreeAdditionalMetadata, DegreeCost, DegreeDeadline, Fact, GeoLocation, IconTextPairing, Organization, ProductMeta,
-    ProductValue, Program, ProgramLocationRestriction, Ranking, Seat, Specialization, TaxiForm
+    CourseLocationRestriction, CourseRun, CourseRunType, CourseType, Curriculum, CurriculumCourseMembership,
+    CurriculumProgramMembership, Degree, DegreeAdditionalMetadata, DegreeCost, DegreeDeadline, Fact, GeoLocation,
+    IconTextPairing, Organization, ProductMeta, ProductValue, Program, ProgramLocationRestriction, Ranking, Seat,
+    Specialization, TaxiForm
 )
 from course_discovery.apps.course_metadata.publishers import ProgramMarketingSitePublisher
 from course_discovery.apps.course_metadata.salesforce import (
@@ -754,6 +756,15 @@ def queue_bulk_operation_celery_task(bulk_operation_task):
     process_bulk_operation.apply_async(args=[bulk_operation_task.id], task_id=task_uuid)
 
 
+@receiver([post_save, post_delete], sender=CourseRunType)
+@receiver([post_save, post_delete], sender=CourseType)
+def clear_retired_type_ids(**kwargs):  # pylint: disable=unused-argument
+    """
+    Drop the cached retired type ids whenever a course or course run type changes.
+    """
+    clear_retired_type_ids_cache()
+
+
 @receiver(post_save, sender=BulkOperationTask)
 def on_bulk_operation_create(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
     """
@@ -1,8 +1,10 @@
 import json
+from functools import cached_property
+from operator import attrgetter
 
 from django_elasticsearch_dsl import Document as OriginDocument
 from django_elasticsearch_dsl_drf.filter_backends import DefaultOrderingFilterBackend
-from django_elasticsearch_dsl_drf.pagination import PageNumberPagination
+from django_elasticsearch_dsl_drf.pagination import PageNumberPagination, QueryFriendlyPageNumberPagination
 from django_elasticsearch_dsl_drf.viewsets import DocumentViewSet as OriginDocumentViewSet
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.utils.urls import replace_query_param
@@ -23,39 +25,47 @@ class MultiDocumentsWrapper:
     behave as one document.
     """
 
+    # Attribute paths which are resolved on every wrapped document.
+    DISPATCHERS = {
+        path: attrgetter(path)
+        for path in ('_index._name', '_doc_type.mapping.properties.name', '_doc_type.name')
+    }
+    # Proper prefixes of the dispatched paths, e.g. `_doc_type.mapping`.
+    INTERMEDIATE_PATHS = frozenset(
+        path.rsplit('.', depth)[0] for path in DISPATCHERS for depth in range(1, path.count('.') + 1)
+    )
+
     def __init__(self, *documents, current_attr=''):
         assert all(
             issubclass(doc, OriginDocument) for doc in documents
         ), '`documents` must be a list of Document subclasses'
         self._documents = documents
         self.current_attr = current_attr
+        self._intermediate_wrappers = {}
 
     def _get_using(self):
         # it's okay to get the first one cause all indices use common connection
         return self._documents[0]._get_using()  # pylint: disable=protected-access
 
-    @property
+    @cached_property
     def _fields(self):
-        fields = {}
-        for doc in self._documents:
-            fields.update(doc._fields)
-        return fields
+        return {name: field for doc in self._documents for name, field in doc._fields.items()}
 
     def dispatch_attr(self, attr):
         current_attr = '{}{}'.format(self.current_attr and '{}.'.format(self.current_attr), attr)
-        # pylint: disable=protected-access
-        dispatchers = {
-            '_index._name': lambda: [doc._index._name for doc in self._documents],
-            '_doc_type.mapping.properties.name': lambda: [
-                doc._doc_type.mapping.properties.name for doc in self._documents
-            ],
-            '_doc_type.name': lambda: [doc._doc_type.name for doc in self._documents],
-        }
-
-        if not any(k.startswith(current_attr) for k in dispatchers):
+
+        dispatcher = self.DISPATCHERS.get(current_attr)
+        if dispatcher:
+            return [dispatcher(doc) for doc in self._documents]
+
+        if current_attr not in self.INTERMEDIATE_PATHS:
             raise AttributeError(attr)
 
-        return dispatchers.get(current_attr, lambda: self.__class__(*self._documents, current_attr=current_attr))()
+        wrapper = self._intermediate_wrappers.get(current_attr)
+        if wrapper is None:
+            wrapper = self.__class__(*self._documents, current_attr=current_attr)
+            self._intermediate_wrappers[current_attr] = wrapper
+        return wrapper
 
     def __getattr__(self, attr):
         """
@@ -102,13 +112,21 @@ class CustomPageNumberPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
 
 
-class SearchAfterPagination(PageNumberPagination):
+class SearchAfterPagination(QueryFriendlyPageNumberPagination):
     """
     Custom paginator that supports Elasticsearch `search_after` pagination.
+
+    The total count is read from the hits of the page query itself,
+    so no separate count request is sent to Elasticsearch. Hits are only
+    counted exactly up to `track_total_hits`; larger result sets report
+    the cap as their `count`. Besides that response field, the count only
+    decides whether a next link is built, which the cap does not affect
+    as long as it exceeds the page size.
     """
 
     page_size_query_param = "page_size"
     search_after_param = "search_after"
+    track_total_hits = 10000
 
     def paginate_queryset(self, queryset, request, view=None):
         """
@@ -120,6 +138,7 @@ class SearchAfterPagination(PageNumberPagination):
                 queryset = queryset.extra(search_after=json.loads(search_after))
             except json.JSONDecodeError as exc:
                 raise ValueError("Invalid JSON format for search_after parameter") from exc
+        queryset = queryset.extra(track_total_hits=self.track_total_hits)
         queryset = super().paginate_queryset(queryset, request, view)
         self.last_obj = queryset[-1] if queryset else None  # pylint: disable=attribute-defined-outside-init
         return queryset
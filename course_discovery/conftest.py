@@ -6,6 +6,7 @@ import pytest
 import pytz
 
 from course_discovery.apps.course_metadata.choices import CourseRunStatus
+from course_discovery.apps.course_metadata.models import CourseType, ProgramType
 from course_discovery.apps.course_metadata.tests.factories import SeatFactory
 
 
@@ -19,6 +20,20 @@ def course_run_states(request):
     request.cls.states, request.cls.available_states = get_course_run_states()
 
 
+@pytest.fixture(scope='session')
+def verified_audit_course_type(django_db_setup, django_db_blocker):  # pylint: disable=unused-argument
+    """ The verified-and-audit CourseType seeded by migrations; looked up once per test session. """
+    with django_db_blocker.unblock():
+        return CourseType.objects.get(slug=CourseType.VERIFIED_AUDIT)
+
+
+@pytest.fixture(scope='session')
+def xseries_program_type(django_db_setup, django_db_blocker):  # pylint: disable=unused-argument
+    """ The XSeries ProgramType seeded by migrations; looked up once per test session. """
+    with django_db_blocker.unblock():
+        return ProgramType.objects.get(translations__name_t='XSeries')
+
+
 def get_course_run_states():
     """
     Utility method to get course_run_states and available_states.
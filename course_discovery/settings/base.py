@@ -470,6 +470,12 @@ ELASTICSEARCH_DSL_QUERYSET_PAGINATION = 10000
 # whose parameters 'size' and 'from' are not explicitly set.
 ELASTICSEARCH_DSL_LOAD_PER_QUERY = 10000
 
+# Bulk request tuning for documents indexed with parallel_bulk (see LearnerPathwayDocument.parallel_bulk).
+# https://elasticsearch-py.readthedocs.io/en/v7.13.4/helpers.html#elasticsearch.helpers.parallel_bulk
+ELASTICSEARCH_BULK_CHUNK_SIZE = 1000
+ELASTICSEARCH_BULK_THREAD_COUNT = 4
+ELASTICSEARCH_BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+
 MAX_RESULT_WINDOW = 15000
 
 ELASTICSEARCH_DSL = {